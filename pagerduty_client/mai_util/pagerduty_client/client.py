@@ -1,22 +1,238 @@
+import asyncio
+import hashlib
 import logging
-from abc import ABC
-from typing import Dict, Optional
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+import weakref
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
 
-import requests
+import orjson
+import urllib3
+from cachetools import TTLCache
 from google.cloud import secretmanager
 
+try:
+    import httpx
+except ImportError:  # Only needed for the async API: pip install "pagerduty-client[async]"
+    httpx = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 PAGERDUTY_EVENTS_API_URL = "https://events.pagerduty.com/v2/enqueue"
 
+# The only field read from Events API responses; scanning for it avoids decoding the whole body.
+_DEDUP_KEY_RE = re.compile(rb'"dedup_key"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Set to "1" (e.g. in local dev and CI) to skip Secret Manager and disable sending events.
+PAGERDUTY_DISABLED_ENV_VAR = "PAGERDUTY_DISABLED"
+
+# A routing_key_secret with this prefix is the routing key itself rather than a secret name.
+INLINE_ROUTING_KEY_PREFIX = "inline:"
+
+# Fail fast when the Events API is unreachable rather than stalling the caller.
+EVENTS_API_CONNECT_TIMEOUT_SECONDS = 2.0
+EVENTS_API_READ_TIMEOUT_SECONDS = 5.0
+
+# Neither urllib3 nor httpx mutate the headers mapping they are given, so one dict serves every call.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared pool so repeated events reuse keep-alive connections to the Events API
+# instead of paying a DNS lookup and TLS handshake per call. urllib3 is used
+# directly since a single POST to a fixed URL needs none of requests' session machinery.
+_POOL = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=16,
+    timeout=urllib3.Timeout(connect=EVENTS_API_CONNECT_TIMEOUT_SECONDS, read=EVENTS_API_READ_TIMEOUT_SECONDS),
+    # At most one retry, so a send blocks the caller for at most two attempts:
+    # ~4s when the API is unreachable, 7s if a response never arrives.
+    retries=urllib3.Retry(
+        total=1,
+        # The Events API asks clients to retry enqueue requests on these statuses.
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        # A timed-out POST may have been accepted; re-sending could open a duplicate incident.
+        read=0,
+        backoff_factor=0.2,
+        backoff_max=1.0,
+        # Never let the server's Retry-After put the caller to sleep.
+        respect_retry_after_header=False,
+        # Hand the final error response back so its body can be logged.
+        raise_on_status=False,
+    ),
+)
+
+# A trigger identical to one that succeeded within this window is answered from
+# memory instead of being re-sent, so alert storms cost one request per window.
+TRIGGER_DEDUP_WINDOW_SECONDS = 60
+
+# Maps (routing_key, severity, dedup_key or summary/source hash) to the incident key PagerDuty returned.
+_RECENT_TRIGGERS: "TTLCache[Tuple[Optional[str], str, str], str]" = TTLCache(
+    maxsize=1024, ttl=TRIGGER_DEDUP_WINDOW_SECONDS
+)
+_RECENT_TRIGGERS_LOCK = threading.Lock()
+
+# Upper bound on events buffered by clients in async_mode before new events are dropped.
+EVENT_QUEUE_MAXSIZE = 1000
+
+# Events queued by async_mode clients, drained by one lazily started worker shared by
+# every client. Each item carries a callback told whether the event was sent.
+_EVENT_QUEUE: "queue.Queue[Tuple[bytes, str, Optional[str], Callable[[bool], None]]]" = queue.Queue(
+    maxsize=EVENT_QUEUE_MAXSIZE
+)
+_EVENT_WORKER: Optional[threading.Thread] = None
+_EVENT_WORKER_LOCK = threading.Lock()
+
+# httpx clients pool connections bound to the event loop that opened them, so each
+# loop gets its own client, created lazily by its first async call and dropped with
+# the loop; see PagerDutyClient.aclose().
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+# Routing keys rarely rotate, so a fetched key is reused for this long before
+# Secret Manager is consulted again.
+ROUTING_KEY_CACHE_TTL_SECONDS = 60 * 60
+
+# Once a cached key is this far into its TTL it is re-read in the background while
+# the cached value keeps being served, so a rotation is picked up without any
+# caller waiting on Secret Manager.
+ROUTING_KEY_REFRESH_AFTER_SECONDS = ROUTING_KEY_CACHE_TTL_SECONDS * 0.75
+
+# Upper bound on how long a constructor waits for an in-flight routing key read.
+ROUTING_KEY_FETCH_TIMEOUT_SECONDS = 30
+
+# After a failed read, Secret Manager is left alone for this long and callers get the
+# same error, so broken permissions or config do not cost an RPC on every send.
+ROUTING_KEY_RETRY_AFTER_FAILURE_SECONDS = 60
+
+# Shared across all client instances in the process, keyed by (gcp_project, secret_name).
+_SECRET_CLIENT: Optional[secretmanager.SecretManagerServiceClient] = None
+_ROUTING_KEY_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_ROUTING_KEY_FETCHES: Dict[Tuple[str, str], "Future[str]"] = {}
+_ROUTING_KEY_FAILURES: Dict[Tuple[str, str], Tuple[Exception, float]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _get_secret_client() -> secretmanager.SecretManagerServiceClient:
+    """Return the process-wide Secret Manager client, creating it on first use."""
+    global _SECRET_CLIENT
+    with _CACHE_LOCK:
+        if _SECRET_CLIENT is None:
+            _SECRET_CLIENT = secretmanager.SecretManagerServiceClient()
+        return _SECRET_CLIENT
+
+
+def _fetch_routing_key(key: Tuple[str, str], future: "Future[str]") -> None:
+    """Read the routing key from Secret Manager and publish it to the cache and the waiting future."""
+    gcp_project, secret_name = key
+    try:
+        secret_path = f"projects/{gcp_project}/secrets/{secret_name}/versions/latest"
+        response = _get_secret_client().access_secret_version(name=secret_path)
+        routing_key = response.payload.data.decode("UTF-8").strip()
+    except Exception as e:
+        with _CACHE_LOCK:
+            if _ROUTING_KEY_FETCHES.get(key) is future:
+                del _ROUTING_KEY_FETCHES[key]
+                _ROUTING_KEY_FAILURES[key] = (e, time.monotonic())
+        future.set_exception(e)
+        return
+
+    with _CACHE_LOCK:
+        # A fetch that is no longer registered was superseded by clear_cache(); its result
+        # must not overwrite the cache or unregister a newer fetch.
+        if _ROUTING_KEY_FETCHES.get(key) is future:
+            del _ROUTING_KEY_FETCHES[key]
+            _ROUTING_KEY_CACHE[key] = (routing_key, time.monotonic())
+            _ROUTING_KEY_FAILURES.pop(key, None)
+    future.set_result(routing_key)
 
-class PagerDutyClient(ABC):
+
+def _log_background_fetch_failure(future: "Future[str]") -> None:
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to fetch PagerDuty routing key in background: %s", error)
+
+
+def _routing_key_future(gcp_project: str, secret_name: str, background: bool = False) -> "Future[str]":
+    """
+    Return a future resolving to the routing key for the given secret.
+
+    A cached key within its TTL resolves immediately; if it is past
+    ROUTING_KEY_REFRESH_AFTER_SECONDS a background re-read is started as well.
+    Within ROUTING_KEY_RETRY_AFTER_FAILURE_SECONDS of a failed read no new read is
+    started, and without a cached key the future fails with that read's error.
+    Otherwise callers asking for the same secret share a single in-flight Secret
+    Manager read, which runs on a daemon thread when ``background`` is set and on
+    the calling thread otherwise.
+    """
+    key = (gcp_project, secret_name)
+    with _CACHE_LOCK:
+        now = time.monotonic()
+        cached = _ROUTING_KEY_CACHE.get(key)
+        age = now - cached[1] if cached is not None else None
+        failure = _ROUTING_KEY_FAILURES.get(key)
+        backing_off = failure is not None and now - failure[1] < ROUTING_KEY_RETRY_AFTER_FAILURE_SECONDS
+        if cached is not None and age < ROUTING_KEY_CACHE_TTL_SECONDS:
+            future: "Future[str]" = Future()
+            future.set_result(cached[0])
+            if age < ROUTING_KEY_REFRESH_AFTER_SECONDS or key in _ROUTING_KEY_FETCHES or backing_off:
+                return future
+            fetch: "Future[str]" = Future()
+            _ROUTING_KEY_FETCHES[key] = fetch
+            background = True
+        else:
+            in_flight = _ROUTING_KEY_FETCHES.get(key)
+            if in_flight is not None:
+                return in_flight
+            future = Future()
+            if backing_off:
+                future.set_exception(failure[0])
+                return future
+            fetch = future
+            _ROUTING_KEY_FETCHES[key] = fetch
+
+    if background:
+        fetch.add_done_callback(_log_background_fetch_failure)
+        threading.Thread(target=_fetch_routing_key, args=(key, fetch), daemon=True).start()
+    else:
+        _fetch_routing_key(key, fetch)
+    return future
+
+
+def _parse_dedup_key(content: bytes) -> Optional[str]:
+    """Extract the dedup_key field from an Events API response body, if present."""
+    match = _DEDUP_KEY_RE.search(content)
+    if match is None:
+        return None
+    raw = match.group(1)
+    # Escaped keys are rare; let a real JSON decoder handle them.
+    return orjson.loads(b'"' + raw + b'"') if b"\\" in raw else raw.decode()
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+    """Return the httpx client used by the async API on the running event loop, creating it on first use."""
+    if httpx is None:
+        raise ImportError('httpx is required for the async PagerDuty API: pip install "pagerduty-client[async]"')
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_CLIENTS[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(EVENTS_API_READ_TIMEOUT_SECONDS, connect=EVENTS_API_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return client
+
+
+class PagerDutyClient:
     """
     Client for sending events to PagerDuty via Events API v2.
 
-    This is a base class that should be subclassed to provide specific
-    routing key secret names. The routing key is retrieved from Google
-    Secret Manager.
+    The routing key is retrieved from Google Secret Manager. Pass the secret
+    name directly, or subclass and set ROUTING_KEY_SECRET to bake it in.
 
     Example:
         class MyPagerDutyClient(PagerDutyClient):
@@ -29,7 +245,7 @@ class PagerDutyClient(ABC):
     # Override in child classes to the correct secret key.
     ROUTING_KEY_SECRET = "PAGERDUTY_ROUTING_KEY"
 
-    def __init__(self, gcp_project: str, routing_key_secret: Optional[str] = None):
+    def __init__(self, gcp_project: str, routing_key_secret: Optional[str] = None, async_mode: bool = False):
         """
         Initialize PagerDuty client.
 
@@ -37,19 +253,278 @@ class PagerDutyClient(ABC):
             gcp_project: Google Cloud Project ID where the secret is stored
             routing_key_secret: Optional override for the secret name.
                               If not provided, uses ROUTING_KEY_SECRET class attribute.
+                              A value of the form "inline:<routing key>" is used as the
+                              routing key directly, without reading Secret Manager.
+            async_mode: If True, trigger_incident and resolve_incident only queue the
+                        event and return immediately; a background thread shared by all
+                        clients sends queued events in order. Call flush() before
+                        shutdown to drain the queue.
         """
         self.gcp_project = gcp_project
         secret_name = routing_key_secret or self.ROUTING_KEY_SECRET
+        # Set when the key comes from Secret Manager, so rotations can be picked up later.
+        self._routing_key_source: Optional[Tuple[str, str]] = None
 
-        # Get routing key from Google Secret Manager
-        try:
-            client = secretmanager.SecretManagerServiceClient()
-            secret_path = f"projects/{gcp_project}/secrets/{secret_name}/versions/latest"
-            response = client.access_secret_version(name=secret_path)
-            self.routing_key = response.payload.data.decode("UTF-8").strip()
-        except Exception as e:
-            logger.error(f"Failed to initialize PagerDuty client: {e}")
+        self._disabled = os.environ.get(PAGERDUTY_DISABLED_ENV_VAR) == "1"
+        if self._disabled:
+            logger.info("PagerDuty client disabled by %s, events will not be sent", PAGERDUTY_DISABLED_ENV_VAR)
             self.routing_key = None
+        elif secret_name.startswith(INLINE_ROUTING_KEY_PREFIX):
+            self.routing_key = secret_name[len(INLINE_ROUTING_KEY_PREFIX) :]
+        else:
+            # Get routing key from Google Secret Manager (cached across instances)
+            self._routing_key_source = (gcp_project, secret_name)
+            try:
+                future = _routing_key_future(gcp_project, secret_name)
+                self.routing_key = future.result(timeout=ROUTING_KEY_FETCH_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.error("Failed to initialize PagerDuty client: %s", e)
+                self.routing_key = None
+
+        self._async_mode = async_mode
+
+    @property
+    def routing_key(self) -> Optional[str]:
+        """The PagerDuty integration routing key, or None if it could not be loaded."""
+        return self._routing_key
+
+    @routing_key.setter
+    def routing_key(self, value: Optional[str]) -> None:
+        # Precompute the constant part of every event so sends only add per-call fields.
+        self._routing_key = value
+        self._trigger_base = {"routing_key": value, "event_action": "trigger"}
+        self._resolve_base = {"routing_key": value, "event_action": "resolve"}
+
+    def _refresh_routing_key(self) -> None:
+        """Adopt a rotated routing key from the shared cache without blocking on Secret Manager."""
+        if self._routing_key_source is None:
+            return
+
+        cached = _ROUTING_KEY_CACHE.get(self._routing_key_source)
+        if (
+            cached is not None
+            and cached[0] == self._routing_key
+            and time.monotonic() - cached[1] < ROUTING_KEY_REFRESH_AFTER_SECONDS
+        ):
+            return
+
+        future = _routing_key_future(*self._routing_key_source, background=True)
+        if future.done() and future.exception() is None and future.result() != self._routing_key:
+            self.routing_key = future.result()
+
+    @classmethod
+    def preload(cls, gcp_project: str, routing_key_secret: Optional[str] = None) -> None:
+        """
+        Start fetching the routing key in the background.
+
+        Call this at module import time (e.g. in a Cloud Function entrypoint) so the
+        Secret Manager read overlaps with startup instead of the first alert.
+        Clients constructed afterwards wait on the same in-flight read.
+
+        Args:
+            gcp_project: Google Cloud Project ID where the secret is stored
+            routing_key_secret: Optional override for the secret name.
+                              If not provided, uses ROUTING_KEY_SECRET class attribute.
+        """
+        secret_name = routing_key_secret or cls.ROUTING_KEY_SECRET
+        if os.environ.get(PAGERDUTY_DISABLED_ENV_VAR) == "1" or secret_name.startswith(INLINE_ROUTING_KEY_PREFIX):
+            return
+        _routing_key_future(gcp_project, secret_name, background=True)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the shared Secret Manager client, all cached routing keys and recently sent triggers."""
+        global _SECRET_CLIENT
+        with _CACHE_LOCK:
+            _SECRET_CLIENT = None
+            _ROUTING_KEY_CACHE.clear()
+            _ROUTING_KEY_FETCHES.clear()
+            _ROUTING_KEY_FAILURES.clear()
+        with _RECENT_TRIGGERS_LOCK:
+            _RECENT_TRIGGERS.clear()
+
+    @staticmethod
+    async def aclose() -> None:
+        """Close the httpx client used by the async API on the running event loop, if one was created."""
+        client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for events queued in async_mode to be sent.
+
+        The queue is shared, so this waits for events queued by every async_mode client.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns:
+            True if the queue was drained, False if the timeout expired first
+        """
+        if not self._async_mode:
+            return True
+
+        with _EVENT_QUEUE.all_tasks_done:
+            return _EVENT_QUEUE.all_tasks_done.wait_for(lambda: not _EVENT_QUEUE.unfinished_tasks, timeout)
+
+    @staticmethod
+    def _encode_event(payload: Dict[str, Any], action: str) -> Optional[bytes]:
+        try:
+            # json.dumps stringified int/float/bool keys in custom_details; keep accepting them.
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError as e:
+            logger.error("Failed to %s PagerDuty incident: %s", action, e)
+            return None
+
+    @classmethod
+    def _enqueue_event(
+        cls, body: bytes, action: str, dedup_key: Optional[str], on_done: Callable[[bool], None]
+    ) -> bool:
+        global _EVENT_WORKER
+        with _EVENT_WORKER_LOCK:
+            if _EVENT_WORKER is None or not _EVENT_WORKER.is_alive():
+                _EVENT_WORKER = threading.Thread(target=cls._drain_queue, name="pagerduty-events", daemon=True)
+                _EVENT_WORKER.start()
+
+        try:
+            _EVENT_QUEUE.put_nowait((body, action, dedup_key, on_done))
+        except queue.Full:
+            logger.error("PagerDuty event queue is full, dropping %s event: %s", action, dedup_key)
+            return False
+        return True
+
+    @classmethod
+    def _drain_queue(cls) -> None:
+        while True:
+            body, action, dedup_key, on_done = _EVENT_QUEUE.get()
+            sent = False
+            try:
+                sent = cls._send_event(body, action) is not None
+                if sent:
+                    logger.info("PagerDuty %s event sent successfully: %s", action, dedup_key)
+            except Exception:
+                # Never let one bad event stop the worker.
+                logger.exception("Unexpected error sending PagerDuty %s event: %s", action, dedup_key)
+            finally:
+                try:
+                    on_done(sent)
+                finally:
+                    _EVENT_QUEUE.task_done()
+
+    @staticmethod
+    def _send_event(body: bytes, action: str) -> Optional[bytes]:
+        """Post an encoded event and return the response body, or None if sending failed."""
+        try:
+            response = _POOL.request("POST", PAGERDUTY_EVENTS_API_URL, body=body, headers=_JSON_HEADERS)
+        except urllib3.exceptions.HTTPError as e:
+            logger.error("Failed to %s PagerDuty incident: %s", action, e)
+            return None
+
+        if response.status >= 400:
+            logger.error("Failed to %s PagerDuty incident: HTTP %s", action, response.status)
+            # Decoding the body is only worth doing if the record will be emitted.
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Response: %s", response.data.decode("UTF-8", errors="replace"))
+            return None
+
+        return response.data
+
+    @staticmethod
+    async def _asend_event(body: bytes, action: str) -> Optional[bytes]:
+        """Async counterpart of _send_event using the running loop's httpx client."""
+        # Outside the try so a missing httpx surfaces as the ImportError, not a failed except clause.
+        client = _get_async_client()
+        try:
+            response = await client.post(PAGERDUTY_EVENTS_API_URL, content=body, headers=_JSON_HEADERS)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPError as e:
+            logger.error("Failed to %s PagerDuty incident: %s", action, e)
+            if isinstance(e, httpx.HTTPStatusError) and logger.isEnabledFor(logging.ERROR):
+                logger.error("Response: %s", e.response.text)
+            return None
+
+    def _build_trigger_payload(
+        self,
+        summary: str,
+        severity: str,
+        source: str,
+        custom_details: Optional[Dict],
+        dedup_key: Optional[str],
+    ) -> Dict[str, Any]:
+        event: Dict[str, Any] = {"summary": summary, "severity": severity, "source": source}
+        if custom_details:
+            event["custom_details"] = custom_details
+
+        payload: Dict[str, Any] = {**self._trigger_base, "payload": event}
+        if dedup_key:
+            payload["dedup_key"] = dedup_key
+
+        return payload
+
+    def _trigger_cache_key(
+        self, summary: str, severity: str, source: str, dedup_key: Optional[str]
+    ) -> Tuple[Optional[str], str, str]:
+        event_key = dedup_key or hashlib.blake2b(f"{summary}|{source}".encode(), digest_size=16).hexdigest()
+        return (self.routing_key, severity, event_key)
+
+    @staticmethod
+    def _recent_trigger(cache_key: Tuple[Optional[str], str, str]) -> Optional[str]:
+        with _RECENT_TRIGGERS_LOCK:
+            incident_key = _RECENT_TRIGGERS.get(cache_key)
+        if incident_key is not None:
+            logger.debug("Suppressing duplicate PagerDuty incident trigger: %s", incident_key)
+        return incident_key
+
+    @staticmethod
+    def _remember_trigger(cache_key: Tuple[Optional[str], str, str], incident_key: Optional[str]) -> None:
+        if incident_key:
+            with _RECENT_TRIGGERS_LOCK:
+                _RECENT_TRIGGERS[cache_key] = incident_key
+
+    @staticmethod
+    def _claim_trigger(cache_key: Tuple[Optional[str], str, str], incident_key: str) -> Optional[str]:
+        # Marks a queued trigger as pending so duplicates queued before it is sent collapse
+        # onto it; returns the key of an earlier trigger if one already holds the slot.
+        with _RECENT_TRIGGERS_LOCK:
+            claimed = _RECENT_TRIGGERS.get(cache_key)
+            if claimed is None:
+                _RECENT_TRIGGERS[cache_key] = incident_key
+        return claimed
+
+    @staticmethod
+    def _settle_trigger(cache_key: Tuple[Optional[str], str, str], incident_key: str, sent: bool) -> None:
+        with _RECENT_TRIGGERS_LOCK:
+            if sent:
+                # Restart the window from the actual send.
+                _RECENT_TRIGGERS[cache_key] = incident_key
+            elif _RECENT_TRIGGERS.get(cache_key) == incident_key:
+                # Release the pending claim so a retry is not suppressed.
+                del _RECENT_TRIGGERS[cache_key]
+
+    def _settle_resolve(self, dedup_key: str, sent: bool) -> None:
+        if sent:
+            self._forget_trigger(dedup_key)
+
+    def _forget_trigger(self, dedup_key: str) -> None:
+        # A resolved incident may legitimately be re-triggered straight away.
+        with _RECENT_TRIGGERS_LOCK:
+            stale = [
+                cache_key
+                for cache_key, incident_key in _RECENT_TRIGGERS.items()
+                if cache_key[0] == self.routing_key and dedup_key in (cache_key[2], incident_key)
+            ]
+            for cache_key in stale:
+                del _RECENT_TRIGGERS[cache_key]
+
+    def _build_resolve_payload(self, dedup_key: str, summary: Optional[str]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {**self._resolve_base, "dedup_key": dedup_key}
+
+        if summary:
+            payload["payload"] = {"summary": summary}
+
+        return payload
 
     def trigger_incident(
         self,
@@ -71,48 +546,58 @@ class PagerDutyClient(ABC):
                       If provided and an incident with this key exists, it will be updated
                       instead of creating a new one.
 
+        A trigger with the same dedup_key (or, without one, the same summary and
+        source) and severity as one sent successfully in the last
+        TRIGGER_DEDUP_WINDOW_SECONDS is not re-sent; the earlier incident key is
+        returned instead.
+
+        In async_mode the event is queued and its dedup_key (generated if not
+        provided) is returned without waiting for PagerDuty.
+
         Returns:
             The dedup_key (incident key) if successful, None otherwise
         """
+        if self._disabled:
+            logger.debug("PagerDuty client disabled, not sending trigger event: %s", summary)
+            return None
+
+        self._refresh_routing_key()
         if not self.routing_key:
             logger.error("PagerDuty routing key not available, cannot trigger incident")
             return None
 
-        payload = {
-            "routing_key": self.routing_key,
-            "event_action": "trigger",
-            "payload": {
-                "summary": summary,
-                "severity": severity,
-                "source": source,
-            },
-        }
+        cache_key = self._trigger_cache_key(summary, severity, source, dedup_key)
+        recent_incident_key = self._recent_trigger(cache_key)
+        if recent_incident_key is not None:
+            return recent_incident_key
 
-        if custom_details:
-            payload["payload"]["custom_details"] = custom_details
+        if self._async_mode:
+            # Generate the key locally since the response is never read.
+            dedup_key = dedup_key or uuid.uuid4().hex
 
-        if dedup_key:
-            payload["dedup_key"] = dedup_key
+        payload = self._build_trigger_payload(summary, severity, source, custom_details, dedup_key)
+        body = self._encode_event(payload, "trigger")
+        if body is None:
+            return None
 
-        try:
-            response = requests.post(
-                PAGERDUTY_EVENTS_API_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-            response.raise_for_status()
+        if self._async_mode:
+            claimed = self._claim_trigger(cache_key, dedup_key)
+            if claimed is not None:
+                return claimed
+            if not self._enqueue_event(body, "trigger", dedup_key, partial(self._settle_trigger, cache_key, dedup_key)):
+                self._settle_trigger(cache_key, dedup_key, sent=False)
+                return None
+            return dedup_key
 
-            result = response.json()
-            incident_key = result.get("dedup_key") or dedup_key
-            logger.info(f"PagerDuty incident triggered successfully: {incident_key}")
-            return incident_key
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to trigger PagerDuty incident: {e}")
-            if hasattr(e, "response") and e.response is not None:
-                logger.error(f"Response: {e.response.text}")
+        content = self._send_event(body, "trigger")
+        if content is None:
             return None
 
+        incident_key = _parse_dedup_key(content) or dedup_key
+        self._remember_trigger(cache_key, incident_key)
+        logger.info("PagerDuty incident triggered successfully: %s", incident_key)
+        return incident_key
+
     def resolve_incident(self, dedup_key: str, summary: Optional[str] = None) -> bool:
         """
         Resolve a PagerDuty incident.
@@ -121,38 +606,110 @@ class PagerDutyClient(ABC):
             dedup_key: The deduplication key of the incident to resolve
             summary: Optional summary message for the resolution
 
+        In async_mode, True means the event was queued.
+
         Returns:
             True if successful, False otherwise
         """
+        if self._disabled:
+            logger.debug("PagerDuty client disabled, not sending resolve event: %s", dedup_key)
+            return False
+
+        self._refresh_routing_key()
         if not self.routing_key:
             logger.error("PagerDuty routing key not available, cannot resolve incident")
             return False
 
-        payload = {
-            "routing_key": self.routing_key,
-            "event_action": "resolve",
-            "dedup_key": dedup_key,
-        }
+        payload = self._build_resolve_payload(dedup_key, summary)
+        body = self._encode_event(payload, "resolve")
+        if body is None:
+            return False
 
-        if summary:
-            payload["payload"] = {"summary": summary}
+        if self._async_mode:
+            # Queued behind any pending trigger for the same incident, so ordering is preserved.
+            return self._enqueue_event(body, "resolve", dedup_key, partial(self._settle_resolve, dedup_key))
 
-        try:
-            response = requests.post(
-                PAGERDUTY_EVENTS_API_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-            response.raise_for_status()
-            logger.info(f"PagerDuty incident resolved successfully: {dedup_key}")
-            return True
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to resolve PagerDuty incident: {e}")
-            if hasattr(e, "response") and e.response is not None:
-                logger.error(f"Response: {e.response.text}")
+        if self._send_event(body, "resolve") is None:
             return False
 
+        self._forget_trigger(dedup_key)
+        logger.info("PagerDuty incident resolved successfully: %s", dedup_key)
+        return True
+
+    async def atrigger_incident(
+        self,
+        summary: str,
+        severity: str = "error",
+        source: str = "mai-service",
+        custom_details: Optional[Dict] = None,
+        dedup_key: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Trigger a PagerDuty incident without blocking the event loop.
+
+        Accepts the same arguments as trigger_incident. Requires the optional
+        httpx dependency. Many incidents can be sent concurrently with
+        asyncio.gather over a single pooled connection set.
+
+        Returns:
+            The dedup_key (incident key) if successful, None otherwise
+        """
+        if self._disabled:
+            logger.debug("PagerDuty client disabled, not sending trigger event: %s", summary)
+            return None
+
+        self._refresh_routing_key()
+        if not self.routing_key:
+            logger.error("PagerDuty routing key not available, cannot trigger incident")
+            return None
+
+        cache_key = self._trigger_cache_key(summary, severity, source, dedup_key)
+        recent_incident_key = self._recent_trigger(cache_key)
+        if recent_incident_key is not None:
+            return recent_incident_key
+
+        payload = self._build_trigger_payload(summary, severity, source, custom_details, dedup_key)
+        body = self._encode_event(payload, "trigger")
+        if body is None:
+            return None
+
+        content = await self._asend_event(body, "trigger")
+        if content is None:
+            return None
+
+        incident_key = _parse_dedup_key(content) or dedup_key
+        self._remember_trigger(cache_key, incident_key)
+        logger.info("PagerDuty incident triggered successfully: %s", incident_key)
+        return incident_key
+
+    async def aresolve_incident(self, dedup_key: str, summary: Optional[str] = None) -> bool:
+        """
+        Resolve a PagerDuty incident without blocking the event loop.
+
+        Accepts the same arguments as resolve_incident. Requires the optional
+        httpx dependency.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._disabled:
+            logger.debug("PagerDuty client disabled, not sending resolve event: %s", dedup_key)
+            return False
+
+        self._refresh_routing_key()
+        if not self.routing_key:
+            logger.error("PagerDuty routing key not available, cannot resolve incident")
+            return False
+
+        payload = self._build_resolve_payload(dedup_key, summary)
+        body = self._encode_event(payload, "resolve")
+        if body is None or await self._asend_event(body, "resolve") is None:
+            return False
+
+        self._forget_trigger(dedup_key)
+        logger.info("PagerDuty incident resolved successfully: %s", dedup_key)
+        return True
+
 
 class PagerDutyAlertClient(PagerDutyClient):
     """
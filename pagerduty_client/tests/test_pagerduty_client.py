@@ -1,27 +1,47 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
-import requests
+import urllib3
 
 from mai_util.pagerduty_client import PagerDutyAlertClient, PagerDutyClient
+from mai_util.pagerduty_client import client as client_module
 
 
-@patch("mai_util.pagerduty_client.secretmanager.SecretManagerServiceClient")
-@patch("mai_util.pagerduty_client.requests.post")
-def test_pagerduty_client_trigger_incident(mock_post, mock_secret_client_cls):
-    # Arrange secret manager to return a fake routing key
-    mock_secret_client = MagicMock()
-    mock_secret_client.access_secret_version.return_value.payload.data.decode.return_value = (
-        "test-routing-key-123"
-    )
-    mock_secret_client_cls.return_value = mock_secret_client
+@pytest.fixture(autouse=True)
+def clear_pagerduty_cache():
+    PagerDutyClient.clear_cache()
+    yield
+    PagerDutyClient.clear_cache()
 
-    # Arrange requests.post to return a successful response
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"dedup_key": "test-incident-key"}
-    mock_response.raise_for_status.return_value = None
-    mock_post.return_value = mock_response
 
+@pytest.fixture
+def routing_key():
+    """Patch Secret Manager to return a fake routing key, yielding the mock secret client."""
+    with patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient") as mock_secret_client_cls:
+        mock_secret_client = mock_secret_client_cls.return_value
+        mock_secret_client.access_secret_version.return_value.payload.data.decode.return_value = (
+            "test-routing-key-123"
+        )
+        yield mock_secret_client
+
+
+@pytest.fixture
+def pool_response():
+    """Patch the shared pool to accept every event, yielding the mock request."""
+    with patch("mai_util.pagerduty_client.client._POOL.request") as mock_request:
+        mock_request.return_value = MagicMock(
+            status=202, data=b'{"status": "success", "dedup_key": "test-incident-key"}'
+        )
+        yield mock_request
+
+
+def test_pagerduty_client_trigger_incident(routing_key, pool_response):
     # Act: instantiate and use the client
     client = PagerDutyClient(
         gcp_project="test-project", routing_key_secret="TEST_ROUTING_KEY"
@@ -34,14 +54,14 @@ def test_pagerduty_client_trigger_incident(mock_post, mock_secret_client_cls):
         dedup_key="test-dedup-key",
     )
 
-    # Assert: requests.post called with expected parameters
+    # Assert: pool.request called with expected parameters
     assert incident_key == "test-incident-key"
-    mock_post.assert_called_once()
-    call_args = mock_post.call_args
-    assert call_args[0][0] == "https://events.pagerduty.com/v2/enqueue"
+    pool_response.assert_called_once()
+    call_args = pool_response.call_args
+    assert call_args[0] == ("POST", "https://events.pagerduty.com/v2/enqueue")
     assert call_args[1]["headers"]["Content-Type"] == "application/json"
 
-    payload = call_args[1]["json"]
+    payload = orjson.loads(call_args[1]["body"])
     assert payload["routing_key"] == "test-routing-key-123"
     assert payload["event_action"] == "trigger"
     assert payload["dedup_key"] == "test-dedup-key"
@@ -51,22 +71,7 @@ def test_pagerduty_client_trigger_incident(mock_post, mock_secret_client_cls):
     assert payload["payload"]["custom_details"]["error"] == "Test error message"
 
 
-@patch("mai_util.pagerduty_client.secretmanager.SecretManagerServiceClient")
-@patch("mai_util.pagerduty_client.requests.post")
-def test_pagerduty_alert_client_trigger_incident(mock_post, mock_secret_client_cls):
-    # Arrange secret manager to return a fake routing key
-    mock_secret_client = MagicMock()
-    mock_secret_client.access_secret_version.return_value.payload.data.decode.return_value = (
-        "test-routing-key-123"
-    )
-    mock_secret_client_cls.return_value = mock_secret_client
-
-    # Arrange requests.post to return a successful response
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"dedup_key": "test-incident-key"}
-    mock_response.raise_for_status.return_value = None
-    mock_post.return_value = mock_response
-
+def test_pagerduty_alert_client_trigger_incident(routing_key, pool_response):
     # Act: instantiate and use the alert client
     client = PagerDutyAlertClient(gcp_project="test-project")
     incident_key = client.trigger_incident(
@@ -75,35 +80,21 @@ def test_pagerduty_alert_client_trigger_incident(mock_post, mock_secret_client_c
 
     # Assert: uses the correct secret name
     assert incident_key == "test-incident-key"
-    mock_secret_client.access_secret_version.assert_called_once()
-    call_args = mock_secret_client.access_secret_version.call_args
-    assert "PAGERDUTY_VALIDATION_ALERTS_ROUTING_KEY" in call_args[0][0]
+    routing_key.access_secret_version.assert_called_once()
+    call_args = routing_key.access_secret_version.call_args
+    assert "PAGERDUTY_VALIDATION_ALERTS_ROUTING_KEY" in call_args[1]["name"]
 
 
-@patch("mai_util.pagerduty_client.secretmanager.SecretManagerServiceClient")
-@patch("mai_util.pagerduty_client.requests.post")
-def test_pagerduty_client_resolve_incident(mock_post, mock_secret_client_cls):
-    # Arrange secret manager to return a fake routing key
-    mock_secret_client = MagicMock()
-    mock_secret_client.access_secret_version.return_value.payload.data.decode.return_value = (
-        "test-routing-key-123"
-    )
-    mock_secret_client_cls.return_value = mock_secret_client
-
-    # Arrange requests.post to return a successful response
-    mock_response = MagicMock()
-    mock_response.raise_for_status.return_value = None
-    mock_post.return_value = mock_response
-
+def test_pagerduty_client_resolve_incident(routing_key, pool_response):
     # Act: instantiate and resolve incident
     client = PagerDutyClient(gcp_project="test-project")
     result = client.resolve_incident("test-dedup-key", summary="Resolved")
 
-    # Assert: requests.post called with expected parameters
+    # Assert: pool.request called with expected parameters
     assert result is True
-    mock_post.assert_called_once()
-    call_args = mock_post.call_args
-    payload = call_args[1]["json"]
+    pool_response.assert_called_once()
+    call_args = pool_response.call_args
+    payload = orjson.loads(call_args[1]["body"])
     assert payload["routing_key"] == "test-routing-key-123"
     assert payload["event_action"] == "resolve"
     assert payload["dedup_key"] == "test-dedup-key"
@@ -111,7 +102,7 @@ def test_pagerduty_client_resolve_incident(mock_post, mock_secret_client_cls):
 
 
 @patch(
-    "mai_util.pagerduty_client.secretmanager.SecretManagerServiceClient",
+    "mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient",
     side_effect=Exception("boom"),
 )
 def test_pagerduty_client_init_failure_sets_routing_key_none(_):
@@ -121,25 +112,407 @@ def test_pagerduty_client_init_failure_sets_routing_key_none(_):
     assert client.trigger_incident("test") is None
     assert client.resolve_incident("test") is False
 
+    # Sends retry the key read in the background; let it finish while Secret Manager is still patched
+    for future in list(client_module._ROUTING_KEY_FETCHES.values()):
+        concurrent.futures.wait([future], timeout=5)
+    assert not client_module._ROUTING_KEY_FETCHES
+
+
+def test_pagerduty_client_trigger_incident_request_exception(routing_key, pool_response):
+    # Arrange the shared pool to raise an exception
+    pool_response.side_effect = urllib3.exceptions.NewConnectionError(None, "Network error")
+
+    # Act: instantiate and use the client
+    client = PagerDutyClient(gcp_project="test-project")
+    incident_key = client.trigger_incident(summary="Test failure")
 
-@patch("mai_util.pagerduty_client.secretmanager.SecretManagerServiceClient")
-@patch("mai_util.pagerduty_client.requests.post")
-def test_pagerduty_client_trigger_incident_request_exception(
-    mock_post, mock_secret_client_cls
-):
-    # Arrange secret manager to return a fake routing key
+    # Assert: returns None on error
+    assert incident_key is None
+
+
+@patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient")
+def test_pagerduty_client_caches_routing_key_across_instances(mock_secret_client_cls):
     mock_secret_client = MagicMock()
     mock_secret_client.access_secret_version.return_value.payload.data.decode.return_value = (
         "test-routing-key-123"
     )
     mock_secret_client_cls.return_value = mock_secret_client
 
-    # Arrange requests.post to raise an exception
-    mock_post.side_effect = requests.exceptions.RequestException("Network error")
+    first = PagerDutyClient(gcp_project="test-project")
+    second = PagerDutyClient(gcp_project="test-project")
+    other = PagerDutyClient(gcp_project="test-project", routing_key_secret="OTHER_SECRET")
+
+    assert first.routing_key == second.routing_key == other.routing_key == "test-routing-key-123"
+    # One Secret Manager client, one RPC per distinct secret
+    mock_secret_client_cls.assert_called_once()
+    assert mock_secret_client.access_secret_version.call_count == 2
+
+
+@patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient")
+def test_pagerduty_client_preload_shares_fetch_with_constructor(mock_secret_client_cls):
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+
+    def slow_access(name):
+        fetch_started.set()
+        release_fetch.wait(timeout=5)
+        response = MagicMock()
+        response.payload.data.decode.return_value = "test-routing-key-123"
+        return response
+
+    mock_secret_client = MagicMock()
+    mock_secret_client.access_secret_version.side_effect = slow_access
+    mock_secret_client_cls.return_value = mock_secret_client
+
+    PagerDutyAlertClient.preload(gcp_project="test-project")
+    assert fetch_started.wait(timeout=5)
+    release_fetch.set()
+
+    client = PagerDutyAlertClient(gcp_project="test-project")
+
+    assert client.routing_key == "test-routing-key-123"
+    mock_secret_client.access_secret_version.assert_called_once()
+
+
+@patch("mai_util.pagerduty_client.client._get_async_client")
+def test_pagerduty_client_atrigger_incident_concurrently(mock_get_async_client, routing_key):
+    # Arrange the async client to echo back each request's dedup key
+    def fake_post(url, content, headers):
+        response = MagicMock()
+        response.content = orjson.dumps({"dedup_key": orjson.loads(content)["dedup_key"]})
+        return response
+
+    mock_async_client = MagicMock()
+    mock_async_client.post = AsyncMock(side_effect=fake_post)
+    mock_get_async_client.return_value = mock_async_client
 
-    # Act: instantiate and use the client
     client = PagerDutyClient(gcp_project="test-project")
-    incident_key = client.trigger_incident(summary="Test failure")
 
-    # Assert: returns None on error
+    async def fan_out():
+        return await asyncio.gather(
+            *(client.atrigger_incident(summary=f"Alert {i}", dedup_key=f"key-{i}") for i in range(3))
+        )
+
+    assert asyncio.run(fan_out()) == ["key-0", "key-1", "key-2"]
+    assert mock_async_client.post.await_count == 3
+    payload = orjson.loads(mock_async_client.post.call_args[1]["content"])
+    assert payload["routing_key"] == "test-routing-key-123"
+    assert payload["event_action"] == "trigger"
+
+
+@patch("mai_util.pagerduty_client.client._get_async_client")
+def test_pagerduty_client_aresolve_incident(mock_get_async_client, routing_key):
+    mock_response = MagicMock()
+    mock_response.content = b'{"status": "success", "dedup_key": "test-dedup-key"}'
+    mock_async_client = MagicMock()
+    mock_async_client.post = AsyncMock(return_value=mock_response)
+    mock_get_async_client.return_value = mock_async_client
+
+    client = PagerDutyClient(gcp_project="test-project")
+    result = asyncio.run(client.aresolve_incident("test-dedup-key", summary="Resolved"))
+
+    assert result is True
+    payload = orjson.loads(mock_async_client.post.call_args[1]["content"])
+    assert payload["event_action"] == "resolve"
+    assert payload["dedup_key"] == "test-dedup-key"
+    assert payload["payload"]["summary"] == "Resolved"
+
+
+def test_pagerduty_client_trigger_incident_unserializable_details(routing_key, pool_response):
+    client = PagerDutyClient(gcp_project="test-project")
+    incident_key = client.trigger_incident(summary="Test failure", custom_details={"bad": object()})
+
+    # Encoding errors are logged and reported like network errors
     assert incident_key is None
+    pool_response.assert_not_called()
+
+
+def test_pagerduty_client_suppresses_duplicate_triggers(routing_key, pool_response):
+    client = PagerDutyClient(gcp_project="test-project")
+
+    # Repeats of the same alert within the window are answered locally
+    keys = [client.trigger_incident(summary="Disk full", source="host-1") for _ in range(5)]
+    assert keys == ["test-incident-key"] * 5
+    assert pool_response.call_count == 1
+
+    # A different alert is still sent
+    client.trigger_incident(summary="Disk full", source="host-2")
+    assert pool_response.call_count == 2
+
+    # Once resolved, the same alert can fire again immediately
+    assert client.resolve_incident("test-incident-key") is True
+    client.trigger_incident(summary="Disk full", source="host-1")
+    assert pool_response.call_count == 4
+
+
+def test_pagerduty_client_async_mode_queues_events(routing_key, pool_response):
+    # Hold the worker until the caller has returned
+    release_post = threading.Event()
+
+    def blocked_post(*args, **kwargs):
+        release_post.wait(timeout=5)
+        return pool_response.return_value
+
+    pool_response.side_effect = blocked_post
+
+    client = PagerDutyClient(gcp_project="test-project", async_mode=True)
+    incident_key = client.trigger_incident(summary="Test failure")
+    assert client.resolve_incident(incident_key) is True
+
+    # Both calls returned before anything was sent
+    assert incident_key
+    assert client.flush(timeout=0.05) is False
+
+    release_post.set()
+    assert client.flush(timeout=5) is True
+
+    # Events are sent in order with the locally generated dedup key
+    assert pool_response.call_count == 2
+    trigger_payload = orjson.loads(pool_response.call_args_list[0][1]["body"])
+    resolve_payload = orjson.loads(pool_response.call_args_list[1][1]["body"])
+    assert trigger_payload["event_action"] == "trigger"
+    assert trigger_payload["dedup_key"] == incident_key
+    assert resolve_payload["event_action"] == "resolve"
+    assert resolve_payload["dedup_key"] == incident_key
+
+
+@patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient")
+def test_pagerduty_client_disabled_skips_secret_manager(mock_secret_client_cls, monkeypatch, caplog):
+    monkeypatch.setenv("PAGERDUTY_DISABLED", "1")
+
+    client = PagerDutyClient(gcp_project="test-project")
+
+    assert client.routing_key is None
+    assert client.trigger_incident("test") is None
+    assert client.resolve_incident("test") is False
+    mock_secret_client_cls.assert_not_called()
+    # Disabled clients stay quiet instead of logging an error per event
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+@patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient")
+def test_pagerduty_client_inline_routing_key(mock_secret_client_cls):
+    client = PagerDutyClient(gcp_project="test-project", routing_key_secret="inline:test-routing-key-123")
+
+    assert client.routing_key == "test-routing-key-123"
+    mock_secret_client_cls.assert_not_called()
+
+
+def test_pagerduty_client_trigger_incident_error_status(routing_key, pool_response):
+    pool_response.return_value.status = 400
+    pool_response.return_value.data = b'{"status": "invalid event", "errors": ["Event object is invalid"]}'
+
+    client = PagerDutyClient(gcp_project="test-project")
+
+    assert client.trigger_incident(summary="Test failure") is None
+    assert client.resolve_incident("test-dedup-key") is False
+
+
+@patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient")
+def test_pagerduty_client_refreshes_routing_key_in_background(mock_secret_client_cls, pool_response):
+    # Arrange secret manager to return a rotated key on the second read
+    mock_secret_client = MagicMock()
+    mock_secret_client.access_secret_version.return_value.payload.data.decode.side_effect = [
+        "routing-key-v1",
+        "routing-key-v2",
+    ]
+    mock_secret_client_cls.return_value = mock_secret_client
+
+    client = PagerDutyClient(gcp_project="test-project")
+    assert client.routing_key == "routing-key-v1"
+
+    # Age the cached key past the refresh point but not past its TTL
+    cache_key = ("test-project", PagerDutyClient.ROUTING_KEY_SECRET)
+    client_module._ROUTING_KEY_CACHE[cache_key] = (
+        "routing-key-v1",
+        time.monotonic() - client_module.ROUTING_KEY_REFRESH_AFTER_SECONDS - 1,
+    )
+
+    # The next event is sent with the cached key while the refresh runs
+    client.trigger_incident(summary="First alert")
+    assert orjson.loads(pool_response.call_args[1]["body"])["routing_key"] == "routing-key-v1"
+
+    deadline = time.monotonic() + 5
+    while client_module._ROUTING_KEY_CACHE[cache_key][0] != "routing-key-v2" and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Later events pick up the rotated key
+    client.trigger_incident(summary="Second alert")
+    assert orjson.loads(pool_response.call_args[1]["body"])["routing_key"] == "routing-key-v2"
+    assert mock_secret_client.access_secret_version.call_count == 2
+
+
+def test_pagerduty_client_trigger_incident_non_str_detail_keys(routing_key, pool_response):
+    client = PagerDutyClient(gcp_project="test-project")
+    incident_key = client.trigger_incident(summary="Test failure", custom_details={844: "failed", 426: "passed"})
+
+    # Non-str keys are stringified like json.dumps did
+    assert incident_key == "test-incident-key"
+    payload = orjson.loads(pool_response.call_args[1]["body"])
+    assert payload["payload"]["custom_details"] == {"844": "failed", "426": "passed"}
+
+
+def test_pagerduty_client_async_mode_retries_after_failed_send(routing_key, pool_response):
+    # First send fails, the retry succeeds
+    pool_response.side_effect = [
+        urllib3.exceptions.NewConnectionError(None, "Network error"),
+        pool_response.return_value,
+    ]
+
+    client = PagerDutyClient(gcp_project="test-project", async_mode=True)
+    first_key = client.trigger_incident(summary="Test failure", dedup_key="test-dedup-key")
+    assert client.flush(timeout=5) is True
+
+    # The failed send must not be treated as a recent duplicate
+    second_key = client.trigger_incident(summary="Test failure", dedup_key="test-dedup-key")
+    assert client.flush(timeout=5) is True
+
+    assert first_key == second_key == "test-dedup-key"
+    assert pool_response.call_count == 2
+
+
+def test_pagerduty_client_async_mode_shares_one_worker(routing_key, pool_response):
+    for i in range(10):
+        client = PagerDutyClient(gcp_project="test-project", async_mode=True)
+        client.trigger_incident(summary=f"Alert {i}")
+    assert client.flush(timeout=5) is True
+
+    workers = [thread for thread in threading.enumerate() if thread.name == "pagerduty-events"]
+    assert len(workers) == 1
+    assert pool_response.call_count == 10
+
+
+@patch("mai_util.pagerduty_client.client.httpx", None)
+def test_pagerduty_client_atrigger_incident_without_httpx():
+    client = PagerDutyClient(gcp_project="test-project", routing_key_secret="inline:test-routing-key-123")
+
+    with pytest.raises(ImportError, match="pagerduty-client\\[async\\]"):
+        asyncio.run(client.atrigger_incident(summary="Test failure"))
+
+
+def test_pagerduty_client_retry_policy(routing_key):
+    client = PagerDutyClient(gcp_project="test-project")
+
+    # Fail every connection attempt below the pool so its retry policy is exercised
+    with patch(
+        "urllib3.connectionpool.HTTPSConnectionPool._make_request",
+        side_effect=urllib3.exceptions.NewConnectionError(None, "Network error"),
+    ) as mock_make_request:
+        assert client.trigger_incident(summary="Test failure") is None
+    assert mock_make_request.call_count == 2
+
+    # A read timeout is not retried, since the first POST may have been accepted
+    with patch(
+        "urllib3.connectionpool.HTTPSConnectionPool._make_request",
+        side_effect=urllib3.exceptions.ReadTimeoutError(None, None, "Read timed out"),
+    ) as mock_make_request:
+        assert client.trigger_incident(summary="Another failure") is None
+    assert mock_make_request.call_count == 1
+
+
+def test_pagerduty_client_atrigger_incident_across_event_loops():
+    import httpx
+
+    def handler(request):
+        return httpx.Response(202, content=b'{"status": "success", "dedup_key": "test-incident-key"}')
+
+    real_async_client = httpx.AsyncClient
+    created_clients = []
+
+    def make_async_client(**kwargs):
+        async_client = real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+        created_clients.append(async_client)
+        return async_client
+
+    client = PagerDutyClient(gcp_project="test-project", routing_key_secret="inline:test-routing-key-123")
+
+    with patch("mai_util.pagerduty_client.client.httpx.AsyncClient", side_effect=make_async_client):
+        # Each asyncio.run gets a fresh loop; the second must not reuse the first loop's client
+        assert asyncio.run(client.atrigger_incident(summary="First alert")) == "test-incident-key"
+        assert asyncio.run(client.atrigger_incident(summary="Second alert")) == "test-incident-key"
+
+    assert len(created_clients) == 2
+    assert created_clients[0] is not created_clients[1]
+
+
+def test_pagerduty_client_async_mode_suppresses_queued_duplicates(routing_key, pool_response):
+    # Hold the worker on the first send while the storm is queued
+    release_post = threading.Event()
+
+    def blocked_post(*args, **kwargs):
+        release_post.wait(timeout=5)
+        return pool_response.return_value
+
+    pool_response.side_effect = blocked_post
+
+    client = PagerDutyClient(gcp_project="test-project", async_mode=True)
+    keys = {client.trigger_incident(summary="Disk full", source="h1") for _ in range(50)}
+
+    release_post.set()
+    assert client.flush(timeout=5) is True
+
+    # Duplicates collapse onto the pending trigger instead of each getting a fresh key
+    assert len(keys) == 1
+    assert pool_response.call_count == 1
+
+
+@patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient")
+def test_pagerduty_client_fetch_superseded_by_clear_cache(mock_secret_client_cls):
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+
+    def slow_access(name):
+        fetch_started.set()
+        release_fetch.wait(timeout=5)
+        response = MagicMock()
+        response.payload.data.decode.return_value = "stale-routing-key"
+        return response
+
+    mock_secret_client = MagicMock()
+    mock_secret_client.access_secret_version.side_effect = slow_access
+    mock_secret_client_cls.return_value = mock_secret_client
+
+    cache_key = ("test-project", PagerDutyClient.ROUTING_KEY_SECRET)
+    PagerDutyClient.preload(gcp_project="test-project")
+    assert fetch_started.wait(timeout=5)
+    stale_fetch = client_module._ROUTING_KEY_FETCHES[cache_key]
+
+    # A newer fetch is registered after the cache is cleared
+    PagerDutyClient.clear_cache()
+    newer_fetch = concurrent.futures.Future()
+    client_module._ROUTING_KEY_FETCHES[cache_key] = newer_fetch
+
+    release_fetch.set()
+    assert stale_fetch.result(timeout=5) == "stale-routing-key"
+
+    # The superseded fetch neither repopulates the cache nor drops the newer fetch
+    assert not client_module._ROUTING_KEY_CACHE
+    assert client_module._ROUTING_KEY_FETCHES == {cache_key: newer_fetch}
+
+
+@patch("mai_util.pagerduty_client.client.secretmanager.SecretManagerServiceClient")
+def test_pagerduty_client_backs_off_after_failed_key_read(mock_secret_client_cls):
+    mock_secret_client = MagicMock()
+    mock_secret_client.access_secret_version.side_effect = PermissionError("denied")
+    mock_secret_client_cls.return_value = mock_secret_client
+
+    client = PagerDutyClient(gcp_project="test-project")
+    assert client.routing_key is None
+
+    # Sends inside the backoff window do not re-read the secret
+    for _ in range(20):
+        assert client.trigger_incident("test") is None
+    assert PagerDutyClient(gcp_project="test-project").routing_key is None
+    assert mock_secret_client.access_secret_version.call_count == 1
+
+    # Once the window has passed, the next send retries in the background
+    cache_key = ("test-project", PagerDutyClient.ROUTING_KEY_SECRET)
+    error, failed_at = client_module._ROUTING_KEY_FAILURES[cache_key]
+    client_module._ROUTING_KEY_FAILURES[cache_key] = (
+        error,
+        failed_at - client_module.ROUTING_KEY_RETRY_AFTER_FAILURE_SECONDS,
+    )
+    client.trigger_incident("test")
+    for future in list(client_module._ROUTING_KEY_FETCHES.values()):
+        concurrent.futures.wait([future], timeout=5)
+    assert mock_secret_client.access_secret_version.call_count == 2